@@ -0,0 +1,226 @@
+"""
+File work of batch flip operations, run on worker threads or processes.
+
+Kept apart from the viewer and free of Tk, so that the worker function is
+pickled into the process pool used for compressed output by reference to
+this module rather than to the GUI module. Spawned worker processes still
+re-import the viewer script as __mp_main__ (tkinter, PIL and the rest of the
+GUI) unless the viewer is started through a separate launcher.
+
+Requires: numpy
+"""
+import shutil  # For copying files in copy-only batch operations
+import threading  # For the per-thread read buffers
+import zipfile  # For reading .npz members into buffers and writing a faster DEFLATE level
+import numpy as np
+
+from Utils.log_utils import get_logger, DEBUG_L3
+
+logger = get_logger()
+
+# Index tuples that reverse a single axis (0, 1 or 2), giving the same view as np.flip
+_FLIP_SLICES = {axis: (slice(None),) * axis + (slice(None, None, -1),) for axis in range(3)}
+
+def _flip_is_noop(arr, axis):
+    """
+    Cheap probe for a flip that leaves the array unchanged.
+    
+    A flip along an axis is a no-op only if the array is symmetric along it, which
+    requires the first and last slices to match. Comparing just those two slices
+    scans a fraction of the data; a True result should be confirmed with a full
+    comparison when certainty matters.
+    
+    Args:
+        arr: Array to be flipped
+        axis: Axis the flip reverses
+        
+    Returns:
+        True if the boundary slices along the axis are equal
+    """
+    return np.array_equal(np.take(arr, 0, axis=axis), np.take(arr, -1, axis=axis))
+
+# Per-thread reusable read buffers for the batch pipeline, see _load_npz_reusing_buffers
+_batch_scratch = threading.local()
+
+def scratch_buffer(key, shape, dtype):
+    """
+    Get a reusable array of the given shape and dtype for the calling thread.
+    
+    Args:
+        key: Array name within the archive (keeps different arrays apart)
+        shape: Array shape
+        dtype: Array dtype
+        
+    Returns:
+        An uninitialized array owned by the calling thread
+    """
+    buffers = getattr(_batch_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _batch_scratch.buffers = {}
+    
+    buf_key = (key, shape, dtype)
+    buf = buffers.get(buf_key)
+    if buf is None:
+        # Keep the cache bounded on datasets with many different shapes
+        if len(buffers) >= 32:
+            buffers.clear()
+        buf = buffers[buf_key] = np.empty(shape, dtype)
+    return buf
+
+def _load_npz_reusing_buffers(fpath):
+    """
+    Load every array of an .npz archive into per-thread reusable buffers.
+    
+    Capture sessions store identically shaped arrays in every file, so reading
+    into the same buffers avoids a fresh multi-megabyte allocation (and the page
+    faults that come with it) for each file. The returned arrays are only valid
+    until the calling thread loads the next file.
+    
+    Falls back to np.load for anything other than plain .npy members
+    (object arrays, unknown format versions, non-array entries). Pickled
+    object arrays are only accepted on that path, with a warning.
+    
+    Args:
+        fpath: Path to the .npz file
+        
+    Returns:
+        Dict mapping array name to array
+    """
+    arrays = {}
+    with zipfile.ZipFile(fpath) as zf:
+        for name in zf.namelist():
+            if not name.endswith('.npy'):
+                break
+            
+            with zf.open(name) as f:
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                elif version == (2, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                else:
+                    break
+                if dtype.hasobject:
+                    break
+                
+                key = name[:-4]
+                buf = scratch_buffer(key, shape[::-1] if fortran_order else shape, dtype)
+                
+                # Read the raw data straight into the buffer
+                raw = memoryview(buf.reshape(-1).view(np.uint8))
+                offset = 0
+                while offset < len(raw):
+                    count = f.readinto(raw[offset:])
+                    if not count:
+                        raise ValueError(f"Truncated array '{key}' in {fpath}")
+                    offset += count
+                
+                arrays[key] = buf.T if fortran_order else buf
+        else:
+            return arrays
+    
+    # Depth datasets are purely numeric, so refuse pickled objects unless a
+    # legacy file actually contains them
+    try:
+        with np.load(fpath, allow_pickle=False) as data:
+            return {k: data[k] for k in data.files}
+    except ValueError:
+        logger.warning("BatchOp", f"{fpath} contains object arrays, loading it with allow_pickle=True")
+        with np.load(fpath, allow_pickle=True) as data:
+            return {k: data[k] for k in data.files}
+
+def _savez_fast_compressed(out_path, arrays, compresslevel=1):
+    """
+    Write arrays to a compressed .npz archive with a configurable DEFLATE level.
+    
+    Same layout as np.savez_compressed (which always uses level 6), so the result
+    loads with np.load as usual. Level 1 compresses several times faster and
+    costs only a few percent in size on depth data.
+    
+    Numeric arrays are written with pickling disabled. Only object arrays are
+    pickled, which only a legacy file accepted by the allow_pickle fallback of
+    _load_npz_reusing_buffers can contain, so such files still round-trip.
+    
+    Args:
+        out_path: Destination file path
+        arrays: Dict mapping array name to array
+        compresslevel: DEFLATE level (1 = fastest, 9 = smallest)
+    """
+    with zipfile.ZipFile(out_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                         compresslevel=compresslevel) as zf:
+        for k, arr in arrays.items():
+            with zf.open(k + '.npy', 'w', force_zip64=True) as f:
+                arr = np.asanyarray(arr)
+                np.lib.format.write_array(f, arr, allow_pickle=arr.dtype.hasobject)
+
+def flip_and_save(fpath, out_path, flip_type, compress=False, full_check=False):
+    """
+    Flip the arrays of a single .npz file and write the result.
+    
+    Pickled by reference to this module into the ProcessPoolExecutor used for
+    compressed output (see the module docstring for what workers still import).
+    
+    Args:
+        fpath: Source .npz file
+        out_path: Destination file path
+        flip_type: 'fliplr', 'flipud' or 'none' (copy only)
+        compress: Write DEFLATE level 1 through _savez_fast_compressed instead of
+            an uncompressed np.savez
+        full_check: Confirm suspected no-op flips with a full array comparison
+        
+    Returns:
+        List of warning messages for arrays whose flip (probably) had no effect
+    """
+    warnings = []
+    
+    # Nothing to flip, so skip the decompress/recompress cycle entirely
+    if flip_type == 'none':
+        shutil.copyfile(fpath, out_path)
+        return warnings
+    
+    # Decompress each key exactly once, into buffers reused across files.
+    # (.npz archives cannot be memory-mapped, so mmap_mode would be ignored.)
+    arrays = _load_npz_reusing_buffers(fpath)
+    
+    # Create a copy of the data for the output
+    flipped = {}
+    
+    # Process each array in the file
+    for k, v in arrays.items():
+        # Only flip arrays with at least 2 dimensions
+        if isinstance(v, np.ndarray) and v.ndim >= 2:
+            # Log the array being flipped for debugging
+            logger.debug_at_level(DEBUG_L3, "BatchOp", f"Flipping array '{k}' with shape {v.shape}")
+            
+            # Check dimensions and use appropriate axis
+            ndim = v.ndim
+            if flip_type == 'fliplr':
+                # For left-right flip, use last dimension (width)
+                flip_axis = min(2, ndim - 1)  # Use axis 2 for 3D+ arrays, axis 1 for 2D arrays
+            else:  # flipud
+                # For up-down flip, use second-to-last dimension (height)
+                flip_axis = min(1, ndim - 2)  # Use axis 1 for 3D+ arrays, axis 0 for 2D arrays
+            
+            logger.debug_at_level(DEBUG_L3, "BatchOp", f"Using flip_axis={flip_axis} for {ndim}D array")
+            
+            # Negative-stride view (like np.flip, without its argument handling);
+            # savez reads it once while writing
+            flipped[k] = v[_FLIP_SLICES[flip_axis]]
+            
+            # Probe the boundary slices only; the full scan to confirm a
+            # no-op is only done when requested
+            if _flip_is_noop(v, flip_axis):
+                if not full_check or np.array_equal(v, flipped[k]):
+                    effect = "had no effect" if full_check else "probably had no effect"
+                    warnings.append(f"Flipping '{k}' {effect}")
+        else:
+            # For non-array types or arrays with fewer dimensions, just copy
+            flipped[k] = v
+    
+    # Save the modified file
+    if compress:
+        _savez_fast_compressed(out_path, flipped)
+    else:
+        np.savez(out_path, **flipped)
+    
+    return warnings
@@ -0,0 +1,216 @@
+"""
+Array kernels for the depth image viewer.
+
+Each kernel has a NumPy implementation and, when Numba is installed, a compiled
+version that runs in a single pass over the data (in parallel across the images
+of a batch where there is one). Numba is optional; without it the NumPy
+versions are used.
+
+Plain reductions such as per-image min/max are left to NumPy, whose SIMD
+loops are faster than a scalar compiled loop.
+
+Requires: numpy (numba optional)
+"""
+import threading  # For serializing launches of the parallel kernel
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    # The viewer runs the kernels on worker threads; the TBB layer can hang at
+    # interpreter exit after being used from a thread other than the main one.
+    # The workqueue layer (used when OpenMP is missing) is not thread-safe and
+    # aborts the process on concurrent launches, which is why every launch of
+    # a parallel kernel holds _parallel_lock.
+    numba.config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+# Held while a parallel=True kernel runs, so only one thread launches one at a time
+_parallel_lock = threading.Lock()
+
+# Element types the compiled kernels are used for (Numba has no float16)
+_NUMBA_DTYPES = frozenset(np.dtype(t) for t in (
+    np.float32, np.float64, np.int8, np.int16, np.int32, np.int64,
+    np.uint8, np.uint16, np.uint32, np.uint64,
+))
+
+# Element types the compiled colormap kernel is used for. Normalization of
+# integer images is done in a promoted float type, left to NumPy.
+_NUMBA_FLOAT_DTYPES = frozenset(np.dtype(t) for t in (np.float32, np.float64))
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _flip_images_numba(depths, lr_mask, ud_mask, out):
+        n, h, w = depths.shape
+        for i in prange(n):
+            for y in range(h):
+                src_y = h - 1 - y if ud_mask[i] else y
+                if lr_mask[i]:
+                    for x in range(w):
+                        out[i, y, x] = depths[i, src_y, w - 1 - x]
+                else:
+                    for x in range(w):
+                        out[i, y, x] = depths[i, src_y, x]
+    
+    @njit(cache=True)
+    def _colormap_image_numba(img, lo, rng, scale, lut, out):
+        h, w = img.shape
+        for y in range(h):
+            for x in range(w):
+                # Same float arithmetic as normalize_depths, then the table lookup
+                v = (img[y, x] - lo) / rng * scale
+                idx = int(v) if v >= 0 and v < 256 else 0
+                out[y, x, 0] = lut[idx, 0]
+                out[y, x, 1] = lut[idx, 1]
+                out[y, x, 2] = lut[idx, 2]
+    
+    @njit(cache=True)
+    def _colormap_sampled_numba(img, rows, cols, lo, rng, scale, lut, out):
+        for y in range(rows.shape[0]):
+            src_y = rows[y]
+            for x in range(cols.shape[0]):
+                v = (img[src_y, cols[x]] - lo) / rng * scale
+                idx = int(v) if v >= 0 and v < 256 else 0
+                out[y, x, 0] = lut[idx, 0]
+                out[y, x, 1] = lut[idx, 1]
+                out[y, x, 2] = lut[idx, 2]
+
+def _use_numba(depths):
+    """Whether the compiled kernels can handle this array."""
+    return (HAVE_NUMBA and depths.ndim == 3 and depths.size > 0
+            and depths.dtype in _NUMBA_DTYPES)
+
+def flip_images(depths, lr_mask, ud_mask):
+    """
+    Copy a batch of images, flipping each one as selected by the masks.
+    
+    Args:
+        depths: Array of shape (N, H, W)
+        lr_mask: Boolean array of length N, True to flip an image left-right
+        ud_mask: Boolean array of length N, True to flip an image up-down
+    
+    Returns:
+        New array of the same shape and dtype as depths
+    """
+    depths = np.asarray(depths)
+    if _use_numba(depths):
+        out = np.empty(depths.shape, dtype=depths.dtype)
+        with _parallel_lock:
+            _flip_images_numba(depths, lr_mask, ud_mask, out)
+        return out
+    
+    # One bulk reversal per axis over the selected images
+    out = np.array(depths)
+    if lr_mask.any():
+        out[lr_mask] = out[lr_mask][:, :, ::-1]
+    if ud_mask.any():
+        out[ud_mask] = out[ud_mask][:, ::-1]
+    return out
+
+def normalize_depths(img, depth_min, depth_max, out=None):
+    """
+    Scale a depth image to uint8, mapping depth_min to 0 and depth_max to 255.
+    
+    Args:
+        img: Depth image of shape (H, W)
+        depth_min: Depth shown as 0
+        depth_max: Depth shown as 255
+        out: Optional uint8 array of shape (H, W) to write the result to
+    
+    Returns:
+        uint8 array of shape (H, W), all zeros if the range is empty
+    """
+    if out is None:
+        out = np.empty(img.shape, dtype=np.uint8)
+    if depth_max > depth_min:
+        # Same arithmetic as (img - min) / range * 255, but with one float scratch
+        # array reused in place and the uint8 cast folded into the last multiply
+        work = np.subtract(img, depth_min, dtype=np.result_type(img, np.float32))
+        np.divide(work, depth_max - depth_min, out=work)
+        np.multiply(work, 255, out=out, casting='unsafe')
+    else:
+        out.fill(0)
+    return out
+
+def colormap_depths(img, depth_min, depth_max, lut, out=None):
+    """
+    Normalize a depth image and color it through a lookup table.
+    
+    The compiled version reads each pixel once and writes its color directly;
+    the result is the same as lut[normalize_depths(img, depth_min, depth_max)].
+    The image may be a flipped (negative-stride) view.
+    
+    Args:
+        img: Depth image of shape (H, W)
+        depth_min: Depth mapped to the first table entry
+        depth_max: Depth mapped to the last table entry
+        lut: uint8 array of shape (256, 3)
+        out: Optional C-contiguous uint8 array of shape (H, W, 3) to write the result to
+    
+    Returns:
+        uint8 array of shape (H, W, 3)
+    """
+    img = np.asarray(img)
+    if (HAVE_NUMBA and img.ndim == 2 and img.size > 0 and img.dtype in _NUMBA_FLOAT_DTYPES
+            and depth_max > depth_min):
+        ftype = img.dtype.type
+        if out is None:
+            out = np.empty(img.shape + (3,), dtype=np.uint8)
+        _colormap_image_numba(img, ftype(depth_min), ftype(depth_max - depth_min), ftype(255), lut, out)
+        return out
+    # Indices are uint8, so 'clip' never clips; it just lets take write to out unbuffered
+    return np.take(lut, normalize_depths(img, depth_min, depth_max), axis=0, out=out, mode='clip')
+
+def colormap_sampled(img, rows, cols, depth_min, depth_max, lut, out=None):
+    """
+    Sample a depth image on a grid of rows and columns, then normalize and color it.
+    
+    The compiled version reads only the sampled pixels and writes their colors
+    directly, without gathering them into a separate array first; the result
+    is the same as colormap_depths(img[rows[:, None], cols], depth_min, depth_max, lut).
+    
+    Args:
+        img: Depth image of shape (H, W)
+        rows: Contiguous intp array of the h row indices to sample
+        cols: Contiguous intp array of the w column indices to sample
+        depth_min: Depth mapped to the first table entry
+        depth_max: Depth mapped to the last table entry
+        lut: uint8 array of shape (256, 3)
+        out: Optional C-contiguous uint8 array of shape (h, w, 3) to write the result to
+    
+    Returns:
+        uint8 array of shape (h, w, 3)
+    """
+    img = np.asarray(img)
+    if (HAVE_NUMBA and img.ndim == 2 and len(rows) > 0 and len(cols) > 0
+            and img.dtype in _NUMBA_FLOAT_DTYPES and depth_max > depth_min):
+        ftype = img.dtype.type
+        if out is None:
+            out = np.empty((len(rows), len(cols), 3), dtype=np.uint8)
+        _colormap_sampled_numba(img, rows, cols, ftype(depth_min), ftype(depth_max - depth_min),
+                                ftype(255), lut, out)
+        return out
+    return colormap_depths(img[rows[:, np.newaxis], cols], depth_min, depth_max, lut, out)
+
+def warm_up():
+    """
+    Compile the kernels for float32 and float64 images ahead of first use.
+    
+    Even with the on-disk cache, the first call of each kernel per element type
+    takes a few hundred milliseconds (loading or compiling it, and starting the
+    threading layer). Calling this on a worker thread at startup moves that
+    cost off the first batch shown. Does nothing without Numba.
+    """
+    if not HAVE_NUMBA:
+        return
+    lut = np.zeros((256, 3), dtype=np.uint8)
+    mask = np.zeros(1, dtype=bool)
+    index = np.arange(2, dtype=np.intp)
+    for dtype in (np.float32, np.float64):
+        flip_images(np.zeros((1, 2, 2), dtype=dtype), mask, mask)
+        colormap_depths(np.arange(4, dtype=dtype).reshape(2, 2), 0, 3, lut)
+        colormap_sampled(np.arange(4, dtype=dtype).reshape(2, 2), index, index, 0, 3, lut)